@@ -10,9 +10,6 @@ Author: Arnav Bhola
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import sys, os
 from src.black_scholes import BlackScholes
 from src.enums import OptionType
 from src.visualization import HeatmapGenerator
@@ -56,6 +53,77 @@ def styled_dataframe(df: pd.DataFrame, index_col: str, precision: int = 2):
     ]).format(f"{{:.{precision}f}}")
 
 
+@st.cache_data(max_entries=128)
+def bs_price_and_greeks(stock_price, strike_price, time_to_exp, risk_free_rate, volatility, option_type=OptionType.CALL_OPTION):
+    """
+    Price an option and compute its Greeks, memoized on the model inputs.
+
+    Returns:
+        tuple (float, list[float], float): Option price, [Delta, Gamma, Vega, Theta, Rho], 
+        and the price of the opposite option type (via put-call parity).
+    """
+    option = BlackScholes(stock_price, strike_price, time_to_exp, risk_free_rate, volatility, option_type)
+    price = option.calculate_price()
+    greeks = option.calculate_greeks()
+    return price, greeks, option.calculate_price_other_type()
+
+
+@st.cache_data(max_entries=32)
+def compute_heatmap_arrays(strike, time_to_exp, risk_free_rate, stock_min, stock_max, vol_min, vol_max, base_call_price, base_put_price, grid_n=10):
+    """
+    Compute all heatmap matrices, memoized on the heatmap inputs.
+
+    Returns:
+        HeatmapGenerator: Generator with grids and value matrices computed.
+    """
+    heatmap_gen = HeatmapGenerator(
+        strike_price=strike,
+        time_to_exp=time_to_exp,
+        risk_free_rate=risk_free_rate,
+        min_stock_price=stock_min,
+        max_stock_price=stock_max,
+        min_volatility=vol_min,
+        max_volatility=vol_max,
+        base_call_price=base_call_price,
+        base_put_price=base_put_price,
+        grid_n=grid_n
+    )
+    heatmap_gen.compute_heatmaps()
+    return heatmap_gen
+
+
+def heatmap_figures(heatmap_gen):
+    """
+    Return the heatmap figures, reusing this session's figures across reruns.
+
+    The first run builds the figures; later runs update them in place, and 
+    skip even that when the plotted arrays are unchanged.
+
+    Args:
+        heatmap_gen (HeatmapGenerator): Generator with computed values.
+
+    Returns:
+        tuple: (call_graph, put_graph, call_pnl_graph, put_pnl_graph) figures.
+    """
+    values_key = b"".join(arr.tobytes() for arr in (
+        heatmap_gen.stock_prices, heatmap_gen.volatilities,
+        heatmap_gen.call_heatmap_values, heatmap_gen.put_heatmap_values,
+        heatmap_gen.call_pnl_heatmap_values, heatmap_gen.put_pnl_heatmap_values
+    ))
+    if "heatmap_figures" not in st.session_state:
+        heatmap_gen.graph_all_heatmaps()
+    elif st.session_state.heatmap_values_key != values_key:
+        heatmap_gen.update_all_heatmaps(*st.session_state.heatmap_figures)
+    else:
+        return st.session_state.heatmap_figures
+
+    st.session_state.heatmap_figures = (
+        heatmap_gen.call_graph, heatmap_gen.put_graph, heatmap_gen.call_pnl_graph, heatmap_gen.put_pnl_graph
+    )
+    st.session_state.heatmap_values_key = values_key
+    return st.session_state.heatmap_figures
+
+
 # ---------------------------- #
 # Sidebar Controls             #
 # ---------------------------- #
@@ -98,12 +166,15 @@ with st.sidebar:
     vol_max = st.slider(
         "Maximum Volatility", min_value=0.01, max_value=1.0, value=volatility * 1.5, step=0.01
     )
+    grid_n = st.slider(
+        "Heatmap Resolution", min_value=5, max_value=100, value=10, step=1
+    )
 
 
 # ---------------------------- #
 # Option Pricing & Greeks       #
 # ---------------------------- #
-option = BlackScholes(
+price, greeks, put_price = bs_price_and_greeks(
     stock_price=current_price,
     strike_price=strike,
     time_to_exp=time_to_exp,
@@ -112,9 +183,6 @@ option = BlackScholes(
     option_type=OptionType.CALL_OPTION  # Could add a selectbox for CALL/PUT
 )
 
-price = option.calculate_price()
-greeks = option.calculate_greeks()
-
 # Display Option Pricing Table
 price_data = {
     "Parameter": [
@@ -160,37 +228,24 @@ Below you can see the calculated option price along with
 # ---------------------------- #
 base_call_price = base_put_price = 0
 if not (volatility < vol_min or volatility > vol_max or current_price < stock_min or current_price > stock_max):
-    base_call_price = BlackScholes(
-        current_price, strike, time_to_exp, risk_free_rate, volatility, OptionType.CALL_OPTION
-    ).calculate_price()
-    base_put_price = BlackScholes(
-        current_price, strike, time_to_exp, risk_free_rate, volatility, OptionType.PUT_OPTION
-    ).calculate_price()
-
-heatmap_gen = HeatmapGenerator(
-    strike_price=strike,
-    time_to_exp=time_to_exp,
-    risk_free_rate=risk_free_rate,
-    min_stock_price=stock_min,
-    max_stock_price=stock_max,
-    min_volatility=vol_min,
-    max_volatility=vol_max,
-    base_call_price=base_call_price,
-    base_put_price=base_put_price
+    # Same inputs as the pricing table above, so reuse its call/put prices
+    base_call_price, base_put_price = price, put_price
+
+heatmap_gen = compute_heatmap_arrays(
+    strike, time_to_exp, risk_free_rate, stock_min, stock_max, vol_min, vol_max, base_call_price, base_put_price, grid_n
 )
-heatmap_gen.compute_heatmaps()
-heatmap_gen.graph_all_heatmaps()
+call_graph, put_graph, call_pnl_graph, put_pnl_graph = heatmap_figures(heatmap_gen)
 
 # Display Heatmaps
 col1, col2 = st.columns(2)
 with col1:
-    st.pyplot(heatmap_gen.call_graph)
+    st.pyplot(call_graph)
 with col2:
-    st.pyplot(heatmap_gen.put_graph)
+    st.pyplot(put_graph)
 
 if base_call_price and base_put_price:
     col1, col2 = st.columns(2)
     with col1:
-        st.pyplot(heatmap_gen.call_pnl_graph)
+        st.pyplot(call_pnl_graph)
     with col2:
-        st.pyplot(heatmap_gen.put_pnl_graph)
+        st.pyplot(put_pnl_graph)
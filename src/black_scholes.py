@@ -6,10 +6,27 @@ and their Greeks (Delta, Gamma, Vega, Theta, Rho) using the Black-Scholes formul
 """
 
 import math
-from scipy.stats import norm
-import numpy as np
+from src.bs_core import bs_vec
 from src.enums import OptionType
 
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+_INV_SQRT_2 = 0.7071067811865475
+
+
+def _cdf(x):
+    """Standard normal cumulative distribution function via math.erf."""
+    if x < -8.0:
+        return 0.0
+    if x > 8.0:
+        return 1.0
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+def _pdf(x):
+    """Standard normal probability density function."""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
 class BlackScholes():
     """
     Black-Scholes option pricer.
@@ -24,7 +41,13 @@ class BlackScholes():
         base_price (float): Reference price for P&L calculations (optional).
         d1 (float | None): Intermediate value used in calculations.
         d2 (float | None): Intermediate value used in calculations.
+        price, delta, gamma, vega, theta, rho (float | None): Computed results.
     """
+    __slots__ = (
+        'stock_price', 'strike_price', 'time_to_exp', 'risk_free_rate', 'volatility',
+        'option_type', 'base_price', 'd1', 'd2', 'price', 'delta', 'gamma', 'vega', 'theta', 'rho'
+    )
+
     def __init__(self, stock_price, strike_price, time_to_exp, risk_free_rate, volatility, option_type=OptionType.CALL_OPTION, base_price=0):
         """Initialize the option parameters."""
         self.stock_price = stock_price
@@ -35,6 +58,26 @@ class BlackScholes():
         self.option_type = option_type
         self.base_price = base_price
         self.d1 = None
+        self.d2 = None
+        self.price = None
+        self.delta = None
+        self.gamma = None
+        self.vega = None
+        self.theta = None
+        self.rho = None
+
+    @classmethod
+    def calculate_price_vec(cls, stock_price, strike_price, time_to_exp, risk_free_rate, volatility, option_type=OptionType.CALL_OPTION):
+        """
+        Compute Black-Scholes prices for whole arrays of options at once.
+
+        Accepts the same parameters as the constructor, as scalars or 
+        broadcastable NumPy arrays, without creating an instance per option.
+
+        Returns:
+            ndarray: Option prices with the broadcast shape of the inputs.
+        """
+        return bs_vec(stock_price, strike_price, time_to_exp, risk_free_rate, volatility, option_type)
 
     def calculate_d1(self):
         """
@@ -43,7 +86,9 @@ class BlackScholes():
         Returns:
             float: The computed d1 value.
         """
-        self.d1 = (math.log(self.stock_price / self.strike_price) + self.time_to_exp * (self.risk_free_rate + ((self.volatility ** 2) / 2))) / (self.volatility * (self.time_to_exp ** 0.5))
+        sigma = self.volatility
+        vol_sqrt_t = sigma * math.sqrt(self.time_to_exp)
+        self.d1 = (math.log(self.stock_price / self.strike_price) + self.time_to_exp * (self.risk_free_rate + 0.5 * sigma * sigma)) / vol_sqrt_t
         return self.d1
     
     def calculate_d2(self):
@@ -53,9 +98,60 @@ class BlackScholes():
         Returns:
             float: The computed d2 value.
         """
-        self.d2 = self.d1 - (self.volatility * (self.time_to_exp ** 0.5))
+        self.d2 = self.d1 - self.volatility * math.sqrt(self.time_to_exp)
         return self.d2
     
+    def compute_all(self):
+        """
+        Compute the option price and all Greeks in a single fused pass.
+
+        d1, d2, N(d1), N(d2), φ(d1), the discount factor and √T are each 
+        evaluated once and shared by every output.
+
+        Returns:
+            dict: Keys d1, d2, price, delta, gamma, vega, theta, rho.
+        """
+        S = self.stock_price
+        K = self.strike_price
+        T = self.time_to_exp
+        r = self.risk_free_rate
+        sigma = self.volatility
+
+        # Derived from the current attributes on every call, since inputs may be reassigned
+        sqrt_t = math.sqrt(T)
+        vol_sqrt_t = sigma * sqrt_t
+        d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        Nd1 = _cdf(d1)
+        Nd2 = _cdf(d2)
+        pdf_d1 = _pdf(d1)
+        df = math.exp(-r * T)
+
+        gamma = pdf_d1 / (S * vol_sqrt_t)
+        vega = S * pdf_d1 * sqrt_t
+        time_decay = -S * pdf_d1 * sigma / (2 * sqrt_t)
+        if self.option_type == OptionType.CALL_OPTION:
+            price = S * Nd1 - K * df * Nd2
+            delta = Nd1
+            theta = time_decay - r * K * df * Nd2
+            rho = S * T * df * Nd2
+        else:
+            # N(-x) = 1 - N(x)
+            price = K * df * (1 - Nd2) - S * (1 - Nd1)
+            delta = Nd1 - 1
+            theta = time_decay + r * K * df * (1 - Nd2)
+            rho = S * T * df * (1 - Nd2)
+
+        self.d1 = d1
+        self.d2 = d2
+        self.price = price
+        self.delta = delta
+        self.gamma = gamma
+        self.vega = vega
+        self.theta = theta
+        self.rho = rho
+        return {"d1": d1, "d2": d2, "price": price, "delta": delta, "gamma": gamma, "vega": vega, "theta": theta, "rho": rho}
+
     def calculate_delta(self):
         """
         Compute Delta, sensitivity of option price to underlying stock price.
@@ -63,9 +159,7 @@ class BlackScholes():
         Returns:
             float: Delta value for call/put option.
         """
-        if self.option_type == OptionType.CALL_OPTION:
-            return norm.cdf(self.d1)
-        return norm.cdf(self.d1) - 1
+        return self.compute_all()["delta"]
     
     def calculate_gamma(self):
         """
@@ -74,7 +168,7 @@ class BlackScholes():
         Returns:
             float: Gamma value.
         """
-        return norm.pdf(self.d1) / (self.stock_price * self.volatility * np.sqrt(self.time_to_exp))
+        return self.compute_all()["gamma"]
     
     def calculate_vega(self):
         """
@@ -83,7 +177,7 @@ class BlackScholes():
         Returns:
             float: Vega value.
         """
-        return self.stock_price * norm.pdf(self.d1) * np.sqrt(self.time_to_exp)
+        return self.compute_all()["vega"]
     
     def calculate_theta(self):
         """
@@ -92,10 +186,7 @@ class BlackScholes():
         Returns:
             float: Theta value for call/put option.
         """
-        if self.option_type == OptionType.CALL_OPTION:
-            return -self.stock_price * norm.pdf(self.d1) * self.volatility / (2 * np.sqrt(self.time_to_exp)) - self.risk_free_rate * self.strike_price * np.exp(-self.risk_free_rate * self.time_to_exp) * norm.cdf(self.d2)
-        else:
-            return -self.stock_price * norm.pdf(self.d1) * self.volatility / (2 * np.sqrt(self.time_to_exp)) + self.risk_free_rate * self.strike_price * np.exp(-self.risk_free_rate * self.time_to_exp) * norm.cdf(-self.d2)
+        return self.compute_all()["theta"]
 
     def calculate_rho(self):
         """
@@ -104,10 +195,7 @@ class BlackScholes():
         Returns:
             float: Rho value for call/put option.
         """
-        if self.option_type == OptionType.CALL_OPTION:
-            return self.stock_price * self.time_to_exp * np.exp(-self.risk_free_rate * self.time_to_exp) * norm.cdf(self.d2)
-        else:
-            return self.stock_price * self.time_to_exp * np.exp(-self.risk_free_rate * self.time_to_exp) * norm.cdf(-self.d2)
+        return self.compute_all()["rho"]
 
     def calculate_price(self):
         """
@@ -116,13 +204,23 @@ class BlackScholes():
         Returns:
             float: Option price for call/put.
         """
-        self.calculate_d1()
-        self.calculate_d2()
+        return self.compute_all()["price"]
+    
+    def calculate_price_other_type(self):
+        """
+        Compute the price of the opposite option type via put-call parity.
+
+        Reuses the already computed price, so no extra CDF evaluations are needed.
+
+        Returns:
+            float: Put price for a call option, or call price for a put option.
+        """
+        if self.price is None:
+            self.compute_all()
+        forward_gap = self.stock_price - self.strike_price * math.exp(-self.risk_free_rate * self.time_to_exp)    # C - P
         if self.option_type == OptionType.CALL_OPTION:
-            self.price = self.stock_price * norm.cdf(self.d1) - self.strike_price * (math.e ** (-1 * self.risk_free_rate * self.time_to_exp)) * norm.cdf(self.d2)
-        elif self.option_type == OptionType.PUT_OPTION:
-            self.price = self.strike_price * (math.e ** (-1 * self.risk_free_rate * self.time_to_exp)) * norm.cdf(-1 * self.d2) - self.stock_price * norm.cdf(-1 * self.d1)
-        return self.price
+            return self.price - forward_gap
+        return self.price + forward_gap
     
     def calculate_greeks(self):
         """
@@ -131,13 +229,6 @@ class BlackScholes():
         Returns:
             list[float]: [Delta, Gamma, Vega, Theta, Rho]
         """
-        if (not self.d1):
-            self.calculate_price()      # Ensures d1/d2 are computed
-        self.delta = self.calculate_delta()
-        self.gamma = self.calculate_gamma()
-        self.vega = self.calculate_vega()
-        self.theta = self.calculate_theta()
-        self.rho = self.calculate_rho()
-        return [self.delta, self.gamma, self.vega, self.theta, self.rho]
-
-    
+        # Always recompute, like the single-Greek methods, so reassigned inputs are picked up
+        result = self.compute_all()
+        return [result["delta"], result["gamma"], result["vega"], result["theta"], result["rho"]]
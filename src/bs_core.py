@@ -0,0 +1,36 @@
+"""
+Vectorized Black-Scholes Core
+
+This module provides a pure function that prices European call/put options 
+over NumPy arrays of inputs, without constructing BlackScholes objects.
+"""
+
+import numpy as np
+from scipy.special import ndtr
+from src.enums import OptionType
+
+
+def bs_vec(S, K, T, r, sigma, option_type=OptionType.CALL_OPTION):
+    """
+    Compute Black-Scholes option prices elementwise over broadcastable inputs.
+
+    Args:
+        S (float | ndarray): Price(s) of the underlying stock.
+        K (float | ndarray): Strike/exercise price(s) of the option.
+        T (float | ndarray): Time(s) to expiration (in years).
+        r (float | ndarray): Annual risk-free interest rate(s) (as a decimal).
+        sigma (float | ndarray): Annual volatility(ies) of the underlying stock (σ).
+        option_type (OptionType): Either CALL_OPTION or PUT_OPTION.
+
+    Returns:
+        ndarray: Option prices with the broadcast shape of the inputs.
+    """
+    S = np.asarray(S, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    vol_sqrt_t = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discounted_strike = K * np.exp(-r * T)
+    if option_type == OptionType.CALL_OPTION:
+        return S * ndtr(d1) - discounted_strike * ndtr(d2)
+    return discounted_strike * ndtr(-d2) - S * ndtr(-d1)
@@ -0,0 +1,66 @@
+"""
+CuPy Black-Scholes Kernels
+
+This module provides an optional GPU version of the fused heatmap grid
+kernel. CuPy is not a required dependency; when it cannot be imported, 
+or no CUDA device is usable, GPU_AVAILABLE is False and callers keep 
+using the Numba kernels.
+"""
+
+import math
+
+try:
+    import cupy as cp
+    from cupyx.scipy.special import ndtr
+except ImportError:
+    cp = None
+
+
+def _has_cuda_device():
+    """Check that CuPy can reach at least one working CUDA device."""
+    if cp is None:
+        return False
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:   # cupy installed without a usable driver/runtime raises CUDARuntimeError
+        return False
+
+
+GPU_AVAILABLE = _has_cuda_device()
+
+# Below this many cells the host <-> device transfers cost more than the GPU saves
+GPU_CELL_THRESHOLD = 10_000
+
+
+def bs_fused_grid_gpu(S, K, T, r, sigma, base_call, base_put):
+    """
+    Compute call/put prices and their P&L for every (volatility, stock price) pair on the GPU.
+
+    Mirrors bs_fused_grid: values are evaluated in float64, rounded to
+    2 decimals and returned as float32 host arrays.
+
+    Args:
+        S (ndarray): 1D array of stock prices (columns).
+        K (float): Strike/exercise price of the option.
+        T (float): Time to expiration (in years).
+        r (float): Annual risk-free interest rate (as a decimal).
+        sigma (ndarray): 1D array of volatilities (rows).
+        base_call (float): Reference call price for P&L.
+        base_put (float): Reference put price for P&L.
+
+    Returns:
+        tuple (ndarray, ndarray, ndarray, ndarray): Call, put, call P&L and put P&L
+        matrices of shape (len(sigma), len(S)).
+    """
+    S = cp.asarray(S, dtype=cp.float64)[None, :]
+    sigma = cp.asarray(sigma, dtype=cp.float64)[:, None]
+    vol_sqrt_t = sigma * math.sqrt(T)
+    d1 = (cp.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discounted_strike = K * math.exp(-r * T)
+
+    call = S * ndtr(d1) - discounted_strike * ndtr(d2)
+    put = cp.maximum(call - S + discounted_strike, 0.0)     # Put-call parity, clipped like the CPU kernel
+    matrices = (call, put, base_call - call, base_put - put)
+    # Round on the device, then copy back only the narrowed float32 results
+    return tuple(cp.asnumpy((cp.rint(m * 100.0) / 100.0).astype(cp.float32)) for m in matrices)
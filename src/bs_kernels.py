@@ -0,0 +1,117 @@
+"""
+Numba Black-Scholes Kernels
+
+This module provides JIT-compiled kernels that evaluate Black-Scholes call 
+and put prices over a 2D grid of stock prices and volatilities.
+"""
+
+import math
+import numpy as np
+from numba import njit
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@njit("float64(float64)", fastmath=True, cache=True)
+def _norm_cdf(x):
+    """Standard normal cumulative distribution function via math.erf."""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+@njit("float64(float64)", fastmath=True, cache=True)
+def _round2(x):
+    """Round to 2 decimals the same way np.round(x, 2) does."""
+    return np.rint(x * 100.0) / 100.0
+
+
+@njit("UniTuple(float64, 5)(float64, float64, float64, float64, float64)", fastmath=True, cache=True)
+def _price_cell(S, K, vol_sqrt_t, drift, discounted_strike):
+    """
+    Price one grid cell; shared by every grid kernel so they cannot diverge.
+
+    Returns:
+        tuple (float, float, float, float, float): Call price, put price, d1, N(d1) and N(d2).
+    """
+    d1 = (math.log(S / K) + drift) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    Nd1 = _norm_cdf(d1)
+    Nd2 = _norm_cdf(d2)
+    call = S * Nd1 - discounted_strike * Nd2
+    # Put-call parity; clip the ~1e-14 cancellation noise of deep out-of-the-money puts
+    put = max(call - S + discounted_strike, 0.0)
+    return call, put, d1, Nd1, Nd2
+
+
+@njit("void(float32[:, :], float32[:, :], float32[:, :], float32[:, :], intp, intp, float64, float64, float64, float64)", fastmath=True, cache=True)
+def _store_prices(out_call, out_put, out_call_pnl, out_put_pnl, i, j, call, put, base_call, base_put):
+    """Write one cell's prices and P&L (base - price), rounded to 2 decimals."""
+    out_call[i, j] = _round2(call)
+    out_put[i, j] = _round2(put)
+    out_call_pnl[i, j] = _round2(base_call - call)
+    out_put_pnl[i, j] = _round2(base_put - put)
+
+
+@njit("void(float64[:], float64, float64, float64, float64[:], float64, float64, float32[:, :], float32[:, :], float32[:, :], float32[:, :])", fastmath=True, cache=True)
+def bs_fused_grid(S, K, T, r, sigma, base_call, base_put, out_call, out_put, out_call_pnl, out_put_pnl):
+    """
+    Compute call/put prices and their P&L for every (volatility, stock price) pair in one pass.
+
+    Each cell is evaluated in float64, rounded to 2 decimals and stored into 
+    float32 outputs; rounding before the narrowing cast keeps the displayed 
+    values identical to a float64 pipeline.
+
+    Args:
+        S (ndarray): 1D array of stock prices (columns).
+        K (float): Strike/exercise price of the option.
+        T (float): Time to expiration (in years).
+        r (float): Annual risk-free interest rate (as a decimal).
+        sigma (ndarray): 1D array of volatilities (rows).
+        base_call (float): Reference call price for P&L.
+        base_put (float): Reference put price for P&L.
+        out_call, out_put (ndarray): float32 output matrices of shape (len(sigma), len(S)) for rounded prices.
+        out_call_pnl, out_put_pnl (ndarray): float32 output matrices of the same shape for rounded P&L (base - price).
+    """
+    sqrt_t = math.sqrt(T)
+    discounted_strike = K * math.exp(-r * T)
+    for i in range(sigma.size):
+        vol_sqrt_t = sigma[i] * sqrt_t
+        drift = (r + 0.5 * sigma[i] * sigma[i]) * T
+        for j in range(S.size):
+            call, put, _, _, _ = _price_cell(S[j], K, vol_sqrt_t, drift, discounted_strike)
+            _store_prices(out_call, out_put, out_call_pnl, out_put_pnl, i, j, call, put, base_call, base_put)
+
+
+@njit("void(float64[:], float64, float64, float64, float64[:], float64, float64, float32[:, :], float32[:, :], float32[:, :], float32[:, :], float64[:, :], float64[:, :], float64[:, :], float64[:, :], float64[:, :], float64[:, :])", fastmath=True, cache=True)
+def bs_fused_greeks_grid(S, K, T, r, sigma, base_call, base_put, out_call, out_put, out_call_pnl, out_put_pnl, out_call_delta, out_put_delta, out_gamma, out_vega, out_call_theta, out_put_theta):
+    """
+    Compute the outputs of bs_fused_grid plus the Greeks of every grid cell in the same pass.
+
+    The Greeks reuse N(d1), N(d2) and φ(d1) from the price evaluation, so no 
+    extra log/erf calls are made. They follow BlackScholes.compute_all and are 
+    stored unrounded in float64.
+
+    Args:
+        S, K, T, r, sigma, base_call, base_put: As for bs_fused_grid.
+        out_call, out_put, out_call_pnl, out_put_pnl (ndarray): As for bs_fused_grid.
+        out_call_delta, out_put_delta (ndarray): float64 output matrices of shape (len(sigma), len(S)) for Delta.
+        out_gamma, out_vega (ndarray): float64 output matrices for Gamma and Vega (identical for calls and puts).
+        out_call_theta, out_put_theta (ndarray): float64 output matrices for Theta.
+    """
+    sqrt_t = math.sqrt(T)
+    discounted_strike = K * math.exp(-r * T)
+    for i in range(sigma.size):
+        vol_sqrt_t = sigma[i] * sqrt_t
+        drift = (r + 0.5 * sigma[i] * sigma[i]) * T
+        for j in range(S.size):
+            call, put, d1, Nd1, Nd2 = _price_cell(S[j], K, vol_sqrt_t, drift, discounted_strike)
+            _store_prices(out_call, out_put, out_call_pnl, out_put_pnl, i, j, call, put, base_call, base_put)
+
+            pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+            time_decay = -S[j] * pdf_d1 * sigma[i] / (2.0 * sqrt_t)
+            out_call_delta[i, j] = Nd1
+            out_put_delta[i, j] = Nd1 - 1.0
+            out_gamma[i, j] = pdf_d1 / (S[j] * vol_sqrt_t)
+            out_vega[i, j] = S[j] * pdf_d1 * sqrt_t
+            out_call_theta[i, j] = time_decay - r * discounted_strike * Nd2
+            out_put_theta[i, j] = time_decay + r * discounted_strike * (1.0 - Nd2)
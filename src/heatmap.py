@@ -5,7 +5,7 @@ This module provides a class to generate a 2D matrix (heatmap) of option
 prices or profit/loss values across a range of stock prices and volatilities.
 """
 import numpy as np
-from .black_scholes import BlackScholes
+from .bs_kernels import bs_fused_grid
 from .enums import OptionType
 
 class Heatmap():
@@ -21,12 +21,15 @@ class Heatmap():
         max_stock_price (float): Maximum stock price for grid.
         min_volatility (float): Minimum volatility value for grid.
         max_volatility (float): Maximum volatility value for grid.
-        heatmap (ndarray): 10x10 numpy array storing computed results.
+        grid_n (int): Number of grid points along each axis (defaults to 10).
+        heatmap (ndarray): grid_n x grid_n numpy array storing computed results.
         isPNL (bool): If True, compute P&L relative to base_price.
         base_price (float): Reference price used for P&L calculations.
+        stock_prices (ndarray | None): Stock price grid, if already generated.
+        volatilities (ndarray | None): Volatility grid, if already generated.
     """
 
-    def __init__(self, strike_price, time_to_exp, risk_free_rate, min_stock_price, max_stock_price, min_volatility, max_volatility, option_type=OptionType.CALL_OPTION, pnl=False, base_price=0):
+    def __init__(self, strike_price, time_to_exp, risk_free_rate, min_stock_price, max_stock_price, min_volatility, max_volatility, option_type=OptionType.CALL_OPTION, pnl=False, base_price=0, stock_prices=None, volatilities=None, grid_n=10):
         """Initialize heatmap parameters and create empty result matrix."""
         self.strike_price = strike_price
         self.time_to_exp = time_to_exp
@@ -36,9 +39,12 @@ class Heatmap():
         self.max_stock_price = max_stock_price
         self.min_volatility = min_volatility
         self.max_volatility = max_volatility
-        self.heatmap = np.zeros((10, 10))
+        self.grid_n = grid_n
+        self.heatmap = np.zeros((grid_n, grid_n))
         self.isPNL = pnl
         self.base_price = base_price
+        self.stock_prices = stock_prices    # Shared grids may be injected to skip generate_grid
+        self.volatilities = volatilities
 
     def generate_grid(self):
         """
@@ -48,8 +54,8 @@ class Heatmap():
             tuple (ndarray, ndarray): Arrays of stock prices and volatilities.
         """
         # Round to 2 decimals for cleaner display
-        self.stock_prices = np.ceil(np.linspace(self.min_stock_price, self.max_stock_price, 10) * 100) / 100
-        self.volatilities = np.ceil(np.linspace(self.min_volatility, self.max_volatility, 10) * 100) / 100
+        self.stock_prices = np.ceil(np.linspace(self.min_stock_price, self.max_stock_price, self.grid_n) * 100) / 100
+        self.volatilities = np.ceil(np.linspace(self.min_volatility, self.max_volatility, self.grid_n) * 100) / 100
         return self.stock_prices, self.volatilities
     
     def compute_matrix(self):
@@ -57,15 +63,16 @@ class Heatmap():
         Compute heatmap of option prices or P&L values.
 
         Returns:
-            ndarray: 10x10 matrix of computed values.
+            ndarray: grid_n x grid_n float32 matrix of computed values, rounded to 2 decimals.
         """
-        for i, vol in enumerate(self.volatilities):
-            for j, s in enumerate(self.stock_prices):
-                option = BlackScholes(s, self.strike_price, self.time_to_exp, self.risk_free_rate, vol, self.option_type, self.base_price)
-                if (self.isPNL):
-                    # Profit/Loss relative to base price
-                    self.heatmap[i, j] = np.round(option.base_price - option.calculate_price(), 2)
-                else:
-                    # Standard option price
-                    self.heatmap[i, j] = np.round(option.calculate_price(), 2)
+        shape = (self.volatilities.size, self.stock_prices.size)
+        call, put, call_pnl, put_pnl = (np.empty(shape, dtype=np.float32) for _ in range(4))
+        # Same fused kernel as HeatmapGenerator, so both paths produce identical values
+        bs_fused_grid(self.stock_prices, self.strike_price, self.time_to_exp, self.risk_free_rate, self.volatilities, self.base_price, self.base_price, call, put, call_pnl, put_pnl)
+
+        if (self.isPNL):
+            # Profit/Loss relative to base price
+            self.heatmap = call_pnl if self.option_type == OptionType.CALL_OPTION else put_pnl
+        else:
+            self.heatmap = call if self.option_type == OptionType.CALL_OPTION else put
         return self.heatmap
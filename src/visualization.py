@@ -1,16 +1,230 @@
 import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+from matplotlib.figure import Figure
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
 import numpy as np
+from PIL import Image
+from src.bs_kernels import bs_fused_grid, bs_fused_greeks_grid
+from src.bs_gpu import GPU_AVAILABLE, GPU_CELL_THRESHOLD, bs_fused_grid_gpu
 from src.heatmap import Heatmap
 from src.enums import OptionType
 
 
-# Custom red -> yellow -> green colormap for P&L style visualization
+# Apply the plot theme once at import rather than on every figure
+sns.set_theme(style="white")
+
+# Custom red -> yellow -> green colormap for P&L style visualization, sampled 
+# once into a fixed 256-entry lookup table so no interpolation happens per plot
 pastel_r2g = LinearSegmentedColormap.from_list(
     "pastel_red_green", ["#ff9f9f", "#ffeeac", "#9eff9e"]
 )
+pastel_r2g = ListedColormap(pastel_r2g(np.linspace(0, 1, pastel_r2g.N)), name="pastel_red_green")
+
+# Grids with more cells than this are drawn without per-cell value annotations
+ANNOT_CELL_LIMIT = 225
+
+# Annotations are shrunk to fit their cells, and dropped if that needs less than this point size
+MIN_ANNOT_FONTSIZE = 7
+_DIGIT_WIDTH_EM = 0.7       # Digit advance in the default font, plus some padding between cells
+
+# Values accepted for HeatmapGenerator's backend argument
+BACKENDS = ("auto", "cpu", "cupy")
+
+# At most this many labelled ticks per axis, so dense grids stay readable
+MAX_TICKS = 8
+
+
+def _set_ticks(ax, xticks, yticks, max_ticks=MAX_TICKS):
+    """
+    Label the columns and rows of a heatmap, thinning the ticks to every n-th cell on dense grids.
+
+    Args:
+        ax (Axes): Axes holding the heatmap image.
+        xticks (Sequence): Labels for the columns.
+        yticks (Sequence): Labels for the rows.
+        max_ticks (int, optional): Maximum number of ticks per axis.
+    """
+    for axis, labels in ((ax.xaxis, xticks), (ax.yaxis, yticks)):
+        stride = -(-len(labels) // max_ticks)       # Ceiling division
+        axis.set_ticks(range(0, len(labels), stride), labels=labels[::stride])
+
+
+def _annotation_fontsize(ax, labels):
+    """
+    Compute the largest font size at which every annotation fits inside its cell.
+
+    Args:
+        ax (Axes): Axes holding the heatmap image.
+        labels (ndarray): 2D array of formatted annotation strings.
+
+    Returns:
+        float: Font size in points, capped at the theme's default size.
+    """
+    box = ax.get_position()
+    cell_width = box.width * ax.figure.get_figwidth() / labels.shape[1]       # Inches
+    cell_height = box.height * ax.figure.get_figheight() / labels.shape[0]
+    widest = np.char.str_len(labels).max()
+    fit = min(cell_width / (widest * _DIGIT_WIDTH_EM), cell_height / 1.2) * 72
+    return min(fit, mpl.rcParams["font.size"])
+
+
+def _annotate(ax, values, annot_cell_limit=ANNOT_CELL_LIMIT):
+    """
+    Write each cell's value into a heatmap, or clear the annotations if they would not fit.
+
+    Sizes the text from the current axes position, so call it after the figure's 
+    layout. Fresh builds and in-place updates both go through here, which keeps 
+    them rendering identically.
+
+    Args:
+        ax (Axes): Axes holding the heatmap image.
+        values (ndarray): 2D matrix of values shown by the image.
+        annot_cell_limit (int, optional): Skip annotations above this many cells, 
+            or when they would be smaller than MIN_ANNOT_FONTSIZE.
+    """
+    fontsize = 0
+    if values.size <= annot_cell_limit:
+        labels = np.char.mod("%.2f", values)    # Format every annotation in one vectorized call
+        fontsize = _annotation_fontsize(ax, labels)
+    if fontsize < MIN_ANNOT_FONTSIZE:
+        for text in list(ax.texts):
+            text.remove()
+        return
+
+    if len(ax.texts) == values.size:
+        # Same grid as before: reuse the existing Text artists
+        for text, label in zip(ax.texts, labels.ravel()):
+            text.set_text(label)
+            text.set_fontsize(fontsize)
+        return
+    for text in list(ax.texts):
+        text.remove()
+    for i in range(values.shape[0]):
+        for j in range(values.shape[1]):
+            ax.text(j, i, labels[i, j], ha='center', va='center', fontsize=fontsize)
+
+
+def _draw_heatmap(ax, values, xticks, yticks, title):
+    """
+    Draw a heatmap into existing axes with matplotlib's imshow.
+
+    Annotations are added separately by _annotate, once the figure is laid out.
+
+    Args:
+        ax (Axes): Axes to draw into; its figure also receives the colorbar.
+        values (ndarray): 2D matrix of values to visualize.
+        xticks (Sequence): Labels for the columns.
+        yticks (Sequence): Labels for the rows.
+        title (str): Title for the plot.
+    """
+    # One block per cell; 'nearest' skips the antialiasing resample on dense grids
+    im = ax.imshow(values, cmap=pastel_r2g, aspect='auto', interpolation='nearest')
+    cbar = ax.figure.colorbar(im, ax=ax)
+    cbar.outline.set_visible(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    _set_ticks(ax, xticks, yticks)
+    ax.set_title(title, fontsize=14)
+    ax.set_xlabel("Stock Price")
+    ax.set_ylabel("Volatility")
+    ax.tick_params(axis='x', rotation=0)
+    ax.tick_params(axis='y', rotation=0)
+    ax.xaxis.tick_bottom()
+    ax.yaxis.tick_left()
+
+
+def _new_figure(figsize):
+    """
+    Create a figure on its own Agg canvas.
+
+    pyplot is bypassed because its global figure manager is not safe to use 
+    from several threads at once.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _layout(fig):
+    """
+    Lay out a figure with tight_layout, starting from the default subplot parameters.
+
+    tight_layout depends on the positions it starts from, so resetting them first 
+    gives an updated figure exactly the layout a fresh build would get.
+    """
+    fig.subplots_adjust(**{param: mpl.rcParams[f"figure.subplot.{param}"] for param in ("left", "right", "bottom", "top", "wspace", "hspace")})
+    fig.tight_layout()
+
+
+def _fast_heatmap(values, xticks, yticks, title):
+    """
+    Draw a laid-out, annotated heatmap with matplotlib's imshow instead of seaborn.
+
+    Args:
+        values (ndarray): 2D matrix of values to visualize.
+        xticks (Sequence): Labels for the columns.
+        yticks (Sequence): Labels for the rows.
+        title (str): Title for the plot.
+
+    Returns:
+        tuple (Figure, Axes): The created figure and its axes.
+    """
+    fig = _new_figure(figsize=(8, 6))
+    ax = fig.subplots()
+    _draw_heatmap(ax, values, xticks, yticks, title)
+    _layout(fig)
+    _annotate(ax, values)
+    return fig, ax
+
+
+def _update_heatmap(fig, values, xticks, yticks):
+    """
+    Update a figure created by _fast_heatmap in place with new values.
+
+    Args:
+        fig (Figure): Figure previously returned by _fast_heatmap.
+        values (ndarray): 2D matrix of the same shape as the original values.
+        xticks (Sequence): Labels for the columns.
+        yticks (Sequence): Labels for the rows.
+    """
+    ax = fig.axes[0]
+    im = ax.images[0]
+    im.set_data(values)
+    im.set_clim(values.min(), values.max())     # Colorbar follows the image's limits
+
+    _set_ticks(ax, xticks, yticks)
+    _layout(fig)        # New tick/colorbar labels may change the margins, as in a fresh build
+    _annotate(ax, values)
+
+
+def _save_png(fig, path, dpi):
+    """
+    Render a figure on its Agg canvas and encode the pixels with Pillow.
+
+    Skips savefig's print_png path and writes with the lowest zlib level, trading 
+    slightly larger files for much cheaper encoding.
+
+    Args:
+        fig (Figure): Figure created by _new_figure.
+        path (str): Destination PNG file.
+        dpi (int): Output resolution.
+    """
+    original_dpi = fig.dpi
+    fig.set_dpi(dpi)
+    try:
+        canvas = fig.canvas
+        canvas.draw()
+        img = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        img.save(path, format='PNG', compress_level=1, dpi=(dpi, dpi))
+    finally:
+        fig.set_dpi(original_dpi)    # Leave on-screen rendering unchanged
+
 
 class HeatmapGenerator():
     """
@@ -26,12 +240,24 @@ class HeatmapGenerator():
         max_volatility (float): Maximum volatility for grid.
         base_call_price (float): Base price for call P&L calculations.
         base_put_price (float): Base price for put P&L calculations.
+        grid_n (int): Number of grid points along each axis (defaults to 10).
+        backend (str): "auto" (GPU for large grids when CuPy is available), "cpu" or "cupy".
+        stock_prices (ndarray): Grid of stock prices shared by all heatmaps.
+        volatilities (ndarray): Grid of volatilities shared by all heatmaps.
         call_heatmap, put_heatmap (Heatmap): Heatmap objects for option prices.
         call_pnl_heatmap, put_pnl_heatmap (Heatmap): Heatmap objects for P&L.
+        greeks (dict[str, ndarray] | None): Greeks matrices from compute_heatmaps(greeks=True).
     """
 
-    def __init__(self,  strike_price, time_to_exp, risk_free_rate, min_stock_price, max_stock_price, min_volatility, max_volatility, base_call_price=0, base_put_price=0):
+    # Matrices of recent computations keyed by their inputs, shared by all instances
+    _matrix_cache = OrderedDict()
+    _matrix_cache_size = 32
+    _matrix_cache_lock = threading.Lock()     # Streamlit sessions share the cache from separate threads
+
+    def __init__(self,  strike_price, time_to_exp, risk_free_rate, min_stock_price, max_stock_price, min_volatility, max_volatility, base_call_price=0, base_put_price=0, grid_n=10, backend="auto"):
         """Initialize heatmap generator with pricing parameters."""
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {', '.join(BACKENDS)}, got {backend!r}")
         self.strike_price = strike_price
         self.time_to_exp = time_to_exp
         self.risk_free_rate = risk_free_rate
@@ -41,36 +267,161 @@ class HeatmapGenerator():
         self.max_volatility = max_volatility
         self.base_call_price = base_call_price
         self.base_put_price = base_put_price
+        self.grid_n = grid_n
+        self.backend = backend
+        self.greeks = None
+        self._saved_figs = {}   # Output filename -> generated Figure, filled at graph time
 
-        # Heatmaps for call/put pricing and P&L
-        self.call_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.CALL_OPTION, base_price=0)
-        self.put_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.PUT_OPTION, base_price=0)
-        self.call_pnl_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.CALL_OPTION, base_price=base_call_price, pnl=True)
-        self.put_pnl_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.PUT_OPTION, base_price=base_put_price, pnl=True)
+        # Heatmaps for call/put pricing and P&L, all sharing one stock price/volatility grid
+        self.call_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.CALL_OPTION, base_price=0, grid_n=grid_n)
+        self.stock_prices, self.volatilities = self.call_heatmap.generate_grid()
+        self._xlabels = np.round(self.stock_prices, 2)     # Tick labels shared by every figure
+        self._ylabels = np.round(self.volatilities, 2)
+        self.put_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.PUT_OPTION, base_price=0, stock_prices=self.stock_prices, volatilities=self.volatilities, grid_n=grid_n)
+        self.call_pnl_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.CALL_OPTION, base_price=base_call_price, pnl=True, stock_prices=self.stock_prices, volatilities=self.volatilities, grid_n=grid_n)
+        self.put_pnl_heatmap = Heatmap(self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, OptionType.PUT_OPTION, base_price=base_put_price, pnl=True, stock_prices=self.stock_prices, volatilities=self.volatilities, grid_n=grid_n)
     
-    def compute_heatmaps(self):
+    def compute_heatmaps(self, greeks=False):
         """
         Compute option price and P&L heatmap matrices.
 
+        Args:
+            greeks (bool, optional): Also compute Greeks matrices in the same grid pass. Defaults to False.
+
         Sets:
-            self.stock_prices (ndarray): Grid of stock prices.
-            self.volatilities (ndarray): Grid of volatilities.
             self.call_heatmap_values, self.put_heatmap_values (ndarray): Option price matrices.
             self.call_pnl_heatmap_values, self.put_pnl_heatmap_values (ndarray): P&L matrices.
+            self.greeks (dict[str, ndarray] | None): call_delta, put_delta, gamma, vega, 
+                call_theta and put_theta matrices if requested, otherwise None.
+        """
+        matrices, greek_matrices = self._cached_matrices(greeks)
+        call_values, put_values, call_pnl_values, put_pnl_values = matrices
+        self.greeks = greek_matrices if greeks else None
+
+        self.call_heatmap.heatmap = call_values
+        self.put_heatmap.heatmap = put_values
+        self.call_pnl_heatmap.heatmap = call_pnl_values
+        self.put_pnl_heatmap.heatmap = put_pnl_values
+
+        self.call_heatmap_values = self.call_heatmap.heatmap
+        self.put_heatmap_values = self.put_heatmap.heatmap
+        self.call_pnl_heatmap_values = self.call_pnl_heatmap.heatmap
+        self.put_pnl_heatmap_values = self.put_pnl_heatmap.heatmap
+
+    def _cache_key(self, use_gpu):
         """
-        # Generate shared grids for stock prices and volatilities
-        [self.stock_prices, self.volatilities] = self.call_heatmap.generate_grid()
-        self.put_heatmap.generate_grid()
-        self.call_pnl_heatmap.generate_grid()
-        self.put_pnl_heatmap.generate_grid()
+        Internal method: Build the tuple of every input the heatmap matrices depend on.
 
-        # Compute heatmap values
-        self.call_heatmap_values = self.call_heatmap.compute_matrix()
-        self.put_heatmap_values = self.put_heatmap.compute_matrix()
-        self.call_pnl_heatmap_values = self.call_pnl_heatmap.compute_matrix()
-        self.put_pnl_heatmap_values = self.put_pnl_heatmap.compute_matrix()
+        Args:
+            use_gpu (bool): Whether the matrices come from the CuPy kernel.
+
+        Returns:
+            tuple: Hashable key for the matrix cache.
+        """
+        return (self.strike_price, self.time_to_exp, self.risk_free_rate, self.min_stock_price, self.max_stock_price, self.min_volatility, self.max_volatility, self.base_call_price, self.base_put_price, self.grid_n, use_gpu)
+
+    def _cached_matrices(self, greeks=False):
+        """
+        Internal method: Return the heatmap matrices, reusing them if these inputs were seen before.
+
+        Args:
+            greeks (bool, optional): Whether the Greeks matrices are needed too. Defaults to False.
 
-    def _graph_heatmap(self, values, title, attr_name):
+        Returns:
+            tuple (tuple, dict | None): Read-only call, put, call P&L and put P&L matrices, 
+            and the read-only Greeks matrices if they have been computed for these inputs.
+        """
+        cache = HeatmapGenerator._matrix_cache
+        use_gpu = not greeks and self._use_gpu()     # The Greeks kernel only exists on the CPU
+        key = self._cache_key(use_gpu)
+        with HeatmapGenerator._matrix_cache_lock:
+            entry = cache.get(key)
+            if entry is not None and (not greeks or entry[1] is not None):
+                cache.move_to_end(key)
+                return entry
+
+        # Computed outside the lock so other sessions are not blocked meanwhile
+        if greeks:
+            matrices, greek_matrices = self._compute_all_matrices_and_greeks()
+        else:
+            matrices, greek_matrices = self._compute_all_matrices(use_gpu), None
+        for matrix in matrices + tuple((greek_matrices or {}).values()):
+            matrix.setflags(write=False)    # Shared between generators, so guard against in-place edits
+        entry = (matrices, greek_matrices)
+        with HeatmapGenerator._matrix_cache_lock:
+            cache[key] = entry
+            cache.move_to_end(key)
+            if len(cache) > HeatmapGenerator._matrix_cache_size:
+                cache.popitem(last=False)   # Evict the least recently used entry
+        return entry
+
+    def _use_gpu(self):
+        """
+        Internal method: Decide whether the matrices are computed with CuPy.
+
+        Returns:
+            bool: True for the "cupy" backend, or for "auto" on large grids when CuPy is available.
+
+        Raises:
+            RuntimeError: If the "cupy" backend is requested but CuPy or a CUDA device is not available.
+        """
+        if self.backend == "cupy":
+            if not GPU_AVAILABLE:
+                raise RuntimeError("The cupy backend was requested but CuPy or a CUDA device is not available")
+            return True
+        if self.backend == "auto":
+            return GPU_AVAILABLE and self.volatilities.size * self.stock_prices.size > GPU_CELL_THRESHOLD
+        return False
+
+    def _compute_all_matrices(self, use_gpu=False):
+        """
+        Internal method: Compute all four heatmap matrices in a single fused grid pass.
+
+        Args:
+            use_gpu (bool, optional): Run the CuPy kernel instead of the Numba one. Defaults to False.
+
+        Returns:
+            tuple (ndarray, ndarray, ndarray, ndarray): Call, put, call P&L and put P&L matrices, 
+            rounded to 2 decimals and stored as float32.
+        """
+        if use_gpu:
+            return bs_fused_grid_gpu(self.stock_prices, self.strike_price, self.time_to_exp, self.risk_free_rate, self.volatilities, self.base_call_price, self.base_put_price)
+
+        shape = (self.volatilities.size, self.stock_prices.size)
+        # float32 halves the memory traffic; the values are only plotted to 2 decimals
+        matrices = tuple(np.empty(shape, dtype=np.float32) for _ in range(4))
+        bs_fused_grid(self.stock_prices, self.strike_price, self.time_to_exp, self.risk_free_rate, self.volatilities, self.base_call_price, self.base_put_price, *matrices)
+        return matrices
+
+    def _compute_all_matrices_and_greeks(self):
+        """
+        Internal method: Compute the four heatmap matrices and the Greeks matrices in one fused grid pass.
+
+        Always runs on the CPU kernel, whatever the backend.
+
+        Returns:
+            tuple (tuple, dict[str, ndarray]): The matrices of _compute_all_matrices, and float64 
+            call_delta, put_delta, gamma, vega, call_theta and put_theta matrices.
+        """
+        shape = (self.volatilities.size, self.stock_prices.size)
+        matrices = tuple(np.empty(shape, dtype=np.float32) for _ in range(4))
+        greek_matrices = {name: np.empty(shape) for name in ("call_delta", "put_delta", "gamma", "vega", "call_theta", "put_theta")}
+        bs_fused_greeks_grid(self.stock_prices, self.strike_price, self.time_to_exp, self.risk_free_rate, self.volatilities, self.base_call_price, self.base_put_price, *matrices, *greek_matrices.values())
+        return matrices, greek_matrices
+
+    def _store_figure(self, fig, attr_name, filename):
+        """
+        Internal method: Attach a figure as an attribute and register it for saving.
+
+        Args:
+            fig (Figure): Figure to store.
+            attr_name (str): Attribute name to assign the figure to.
+            filename (str): PNG filename used by save_heatmaps.
+        """
+        setattr(self, attr_name, fig)
+        self._saved_figs[filename] = fig
+
+    def _graph_heatmap(self, values, title, attr_name, filename):
         """
         Internal method: Create a heatmap figure and attach it as an attribute.
 
@@ -78,33 +429,29 @@ class HeatmapGenerator():
             values (ndarray): Heatmap values to visualize.
             title (str): Title for the plot.
             attr_name (str): Attribute name to assign the figure to.
+            filename (str): PNG filename used by save_heatmaps.
         """
-
-        sns.set_theme(style="white")
-        fig, ax = plt.subplots(figsize=(8, 6))
-
-        sns.heatmap(
+        fig, ax = _fast_heatmap(
             values,
-            ax=ax,
-            xticklabels=[round(s, 2) for s in self.stock_prices],
-            yticklabels=[round(v, 2) for v in self.volatilities],
-            cmap=pastel_r2g,
-            annot=True,
-            fmt=".2f",
-            cbar=True,
-            linecolor='gray'
+            xticks=self._xlabels,
+            yticks=self._ylabels,
+            title=title
         )
-        ax.set_title(title, fontsize=14)
-        ax.set_xlabel("Stock Price")
-        ax.set_ylabel("Volatility")
-        ax.tick_params(axis='x', rotation=0)
-        ax.tick_params(axis='y', rotation=0)
-        ax.xaxis.tick_bottom()
-        ax.yaxis.tick_left()
-
-        plt.tight_layout()
-        setattr(self, attr_name, fig)  # Store figure as attribute
-        plt.close(fig)  # Prevents immediate display
+        self._store_figure(fig, attr_name, filename)
+
+    def _heatmap_jobs(self):
+        """
+        Internal method: List the (values, title, attr_name, filename) of every heatmap.
+
+        Returns:
+            list[tuple]: One entry per heatmap, in display order.
+        """
+        return [
+            (self.call_heatmap_values, "CALL", "call_graph", "call_heatmap.png"),
+            (self.put_heatmap_values, "PUT", "put_graph", "put_heatmap.png"),
+            (self.call_pnl_heatmap_values, "CALL P&L Ratio", "call_pnl_graph", "call_pnl_heatmap.png"),
+            (self.put_pnl_heatmap_values, "PUT P&L Ratio", "put_pnl_graph", "put_pnl_heatmap.png"),
+        ]
 
     def graph_all_heatmaps(self):
         """
@@ -113,28 +460,51 @@ class HeatmapGenerator():
         Sets:
             self.call_graph, self.put_graph, self.call_pnl_graph, self.put_pnl_graph
         """
-        self._graph_heatmap(self.call_heatmap_values, "CALL", "call_graph")
-        self._graph_heatmap(self.put_heatmap_values, "PUT", "put_graph")
-        self._graph_heatmap(self.call_pnl_heatmap_values, "CALL P&L Ratio", "call_pnl_graph")
-        self._graph_heatmap(self.put_pnl_heatmap_values, "PUT P&L Ratio", "put_pnl_graph")
+        jobs = self._heatmap_jobs()
+        # Each figure is independent, so they can be rendered concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self._graph_heatmap, *job) for job in jobs]
+        for future in futures:
+            future.result()     # Re-raise any rendering error
+
+    def update_all_heatmaps(self, call_graph, put_graph, call_pnl_graph, put_pnl_graph):
+        """
+        Redraw previously generated figures in place with the current heatmap values.
+
+        Falls back to graph_all_heatmaps if the grid shape no longer matches.
+
+        Args:
+            call_graph, put_graph, call_pnl_graph, put_pnl_graph (Figure): Figures 
+                from an earlier graph_all_heatmaps call.
+
+        Sets:
+            self.call_graph, self.put_graph, self.call_pnl_graph, self.put_pnl_graph
+        """
+        figures = [call_graph, put_graph, call_pnl_graph, put_pnl_graph]
+        jobs = self._heatmap_jobs()
+        if any(fig.axes[0].images[0].get_array().shape != values.shape for fig, (values, *_) in zip(figures, jobs)):
+            self.graph_all_heatmaps()
+            return
+
+        for fig, (values, _, attr_name, filename) in zip(figures, jobs):
+            _update_heatmap(fig, values, self._xlabels, self._ylabels)
+            self._store_figure(fig, attr_name, filename)
 
-    def save_heatmaps(self, save_dir="heatmaps"):
+    def save_heatmaps(self, save_dir="heatmaps", dpi=150):
         """
         Save all generated heatmap figures to disk.
 
         Args:
             save_dir (str, optional): Directory to save PNG images. Defaults to "heatmaps".
+            dpi (int, optional): Output resolution. Defaults to 150.
         """
         os.makedirs(save_dir, exist_ok=True)
 
-        save_map = {
-            "call_graph": "call_heatmap.png",
-            "put_graph": "put_heatmap.png",
-            "call_pnl_graph": "call_pnl_heatmap.png",
-            "put_pnl_graph": "put_pnl_heatmap.png",
-        }
-
-        for attr, filename in save_map.items():
-            if hasattr(self, attr):
-                fig = getattr(self, attr)
-                fig.savefig(os.path.join(save_dir, filename), dpi=300)
\ No newline at end of file
+        # Figures are independent, so one can be drawn while another is PNG-encoded
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(_save_png, fig, os.path.join(save_dir, filename), dpi)
+                for filename, fig in self._saved_figs.items()
+            ]
+        for future in futures:
+            future.result()     # Re-raise any saving error
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Tests for the Streamlit app's heatmap figure reuse across reruns.
+"""
+
+import os
+import unittest
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+class TestHeatmapFigures(unittest.TestCase):
+
+    def setUp(self):
+        self.app = AppTest.from_file(APP_PATH, default_timeout=120).run()
+        self.assertFalse(self.app.exception)
+
+    def test_unchanged_inputs_reuse_figures(self):
+        figures = self.app.session_state["heatmap_figures"]
+        self.app.run()
+        self.assertFalse(self.app.exception)
+        self.assertIs(self.app.session_state["heatmap_figures"], figures)
+
+    def test_new_values_update_figures_in_place(self):
+        figures = self.app.session_state["heatmap_figures"]
+        values_key = self.app.session_state["heatmap_values_key"]
+        strike = next(widget for widget in self.app.number_input if widget.label == "Strike Price")
+        strike.set_value(110.0).run()
+        self.assertFalse(self.app.exception)
+
+        self.assertNotEqual(self.app.session_state["heatmap_values_key"], values_key)
+        for updated, previous in zip(self.app.session_state["heatmap_figures"], figures):
+            self.assertIs(updated, previous)
+
+    def test_resolution_change_rebuilds_figures(self):
+        figures = self.app.session_state["heatmap_figures"]
+        resolution = next(widget for widget in self.app.slider if widget.label == "Heatmap Resolution")
+        resolution.set_value(12).run()
+        self.assertFalse(self.app.exception)
+
+        for updated, previous in zip(self.app.session_state["heatmap_figures"], figures):
+            self.assertIsNot(updated, previous)
+            self.assertEqual(updated.axes[0].images[0].get_array().shape, (12, 12))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the scalar BlackScholes pricer.
+"""
+
+import unittest
+import numpy as np
+from scipy.stats import norm
+from src.black_scholes import BlackScholes
+from src.enums import OptionType
+
+
+class TestBlackScholes(unittest.TestCase):
+
+    def test_reprices_after_inputs_change(self):
+        """Reassigned inputs are picked up on the next calculation."""
+        option = BlackScholes(100, 100, 1, 0.05, 0.2)
+        self.assertAlmostEqual(option.calculate_price(), 10.4506, places=4)
+
+        option.volatility = 0.4
+        self.assertAlmostEqual(option.calculate_price(), 18.0230, places=4)
+        self.assertAlmostEqual(option.calculate_price(), BlackScholes(100, 100, 1, 0.05, 0.4).calculate_price(), places=12)
+
+        option.time_to_exp = 0.5
+        expected = BlackScholes(100, 100, 0.5, 0.05, 0.4)
+        self.assertAlmostEqual(option.calculate_price(), expected.calculate_price(), places=12)
+        self.assertAlmostEqual(option.calculate_d1(), expected.calculate_d1(), places=12)
+        self.assertAlmostEqual(option.calculate_d2(), expected.calculate_d2(), places=12)
+
+    def test_greeks_after_inputs_change(self):
+        """calculate_greeks agrees with the single-Greek methods after an input is reassigned."""
+        option = BlackScholes(100, 100, 1, 0.05, 0.2)
+        option.calculate_price()
+        option.volatility = 0.4
+
+        greeks = option.calculate_greeks()
+        expected = BlackScholes(100, 100, 1, 0.05, 0.4).calculate_greeks()
+        for actual, reference in zip(greeks, expected):
+            self.assertAlmostEqual(actual, reference, places=12)
+        self.assertAlmostEqual(greeks[0], option.calculate_delta(), places=12)
+        self.assertAlmostEqual(greeks[1], option.calculate_gamma(), places=12)
+
+    def test_put_call_parity(self):
+        """The parity price of the other type matches pricing that type directly."""
+        call = BlackScholes(110, 100, 0.75, 0.03, 0.25, OptionType.CALL_OPTION)
+        put = BlackScholes(110, 100, 0.75, 0.03, 0.25, OptionType.PUT_OPTION)
+        self.assertAlmostEqual(call.calculate_price_other_type(), put.calculate_price(), places=10)
+        self.assertAlmostEqual(put.calculate_price_other_type(), call.calculate_price(), places=10)
+
+
+
+class TestCalculatePriceVec(unittest.TestCase):
+
+    STRIKE = 100.0
+    TIME_TO_EXP = 0.5
+    RATE = 0.04
+    # Broadcast to a (volatility, stock price) grid, from deep out-of-the-money to deep in-the-money
+    STOCK_PRICES = np.array([10.0, 70.0, 99.0, 100.0, 101.0, 130.0, 300.0])[None, :]
+    VOLATILITIES = np.array([0.05, 0.25, 0.8, 2.0])[:, None]
+
+    def scipy_prices(self):
+        S, sigma, K, T, r = self.STOCK_PRICES, self.VOLATILITIES, self.STRIKE, self.TIME_TO_EXP, self.RATE
+        d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+        d2 = d1 - sigma * np.sqrt(T)
+        call = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        put = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        return call, put
+
+    def test_matches_scipy_and_scalar_path(self):
+        references = dict(zip((OptionType.CALL_OPTION, OptionType.PUT_OPTION), self.scipy_prices()))
+        for option_type, reference in references.items():
+            prices = BlackScholes.calculate_price_vec(self.STOCK_PRICES, self.STRIKE, self.TIME_TO_EXP, self.RATE, self.VOLATILITIES, option_type)
+            self.assertEqual(prices.shape, (self.VOLATILITIES.size, self.STOCK_PRICES.size))
+            np.testing.assert_allclose(prices, reference, rtol=1e-12, atol=1e-12)
+
+            for (i, j), price in np.ndenumerate(prices):
+                scalar = BlackScholes(self.STOCK_PRICES[0, j], self.STRIKE, self.TIME_TO_EXP, self.RATE, self.VOLATILITIES[i, 0], option_type).calculate_price()
+                self.assertAlmostEqual(price, scalar, delta=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
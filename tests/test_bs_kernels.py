@@ -0,0 +1,98 @@
+"""
+Tests for the Numba Black-Scholes grid kernels.
+"""
+
+import unittest
+import numpy as np
+from scipy.stats import norm
+from src.black_scholes import BlackScholes
+from src.bs_kernels import _norm_cdf, bs_fused_grid, bs_fused_greeks_grid
+from src.enums import OptionType
+
+# Strike 100: stock prices run from deep out-of-the-money to deep in-the-money calls
+STRIKE = 100.0
+TIME_TO_EXP = 0.75
+RATE = 0.05
+STOCK_PRICES = np.array([5.0, 60.0, 95.0, 100.0, 105.0, 140.0, 400.0])
+VOLATILITIES = np.array([0.05, 0.2, 0.6, 1.5])
+
+
+def scipy_prices(S, sigma):
+    """Reference call and put prices from scipy.stats.norm."""
+    vol_sqrt_t = sigma * np.sqrt(TIME_TO_EXP)
+    d1 = (np.log(S / STRIKE) + (RATE + 0.5 * sigma ** 2) * TIME_TO_EXP) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    discounted_strike = STRIKE * np.exp(-RATE * TIME_TO_EXP)
+    call = S * norm.cdf(d1) - discounted_strike * norm.cdf(d2)
+    put = discounted_strike * norm.cdf(-d2) - S * norm.cdf(-d1)
+    return call, put
+
+
+class TestNormCdf(unittest.TestCase):
+
+    def test_matches_scipy(self):
+        """The fastmath erf-based CDF agrees with scipy across and beyond the typical d range."""
+        for x in np.linspace(-12.0, 12.0, 481):
+            self.assertAlmostEqual(_norm_cdf(x), norm.cdf(x), places=14)
+
+
+class TestFusedGrid(unittest.TestCase):
+
+    def setUp(self):
+        shape = (VOLATILITIES.size, STOCK_PRICES.size)
+        self.base_call, self.base_put = 7.5, 4.0
+        self.call, self.put, self.call_pnl, self.put_pnl = (np.empty(shape, dtype=np.float32) for _ in range(4))
+        bs_fused_grid(STOCK_PRICES, STRIKE, TIME_TO_EXP, RATE, VOLATILITIES, self.base_call, self.base_put, self.call, self.put, self.call_pnl, self.put_pnl)
+        self.ref_call, self.ref_put = scipy_prices(STOCK_PRICES[None, :], VOLATILITIES[:, None])
+
+    def assertRoundedClose(self, actual, expected):
+        """Kernel outputs are rounded to 2 decimals and stored as float32."""
+        np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=0.005 + 1e-9)
+
+    def test_prices_match_scipy(self):
+        self.assertRoundedClose(self.call, self.ref_call)
+        self.assertRoundedClose(self.put, self.ref_put)
+
+    def test_pnl_matches_scipy(self):
+        self.assertRoundedClose(self.call_pnl, self.base_call - self.ref_call)
+        self.assertRoundedClose(self.put_pnl, self.base_put - self.ref_put)
+
+    def test_prices_match_black_scholes(self):
+        for i, sigma in enumerate(VOLATILITIES):
+            for j, S in enumerate(STOCK_PRICES):
+                call = BlackScholes(S, STRIKE, TIME_TO_EXP, RATE, sigma, OptionType.CALL_OPTION).calculate_price()
+                put = BlackScholes(S, STRIKE, TIME_TO_EXP, RATE, sigma, OptionType.PUT_OPTION).calculate_price()
+                self.assertAlmostEqual(float(self.call[i, j]), call, delta=0.005 + 1e-4)
+                self.assertAlmostEqual(float(self.put[i, j]), put, delta=0.005 + 1e-4)
+
+    def test_outputs_are_rounded_and_non_negative(self):
+        for matrix in (self.call, self.put, self.call_pnl, self.put_pnl):
+            scaled = matrix.astype(np.float64) * 100
+            np.testing.assert_allclose(scaled, np.rint(scaled), atol=1e-2)
+        self.assertTrue((self.call >= 0).all())
+        self.assertTrue((self.put >= 0).all())
+        self.assertFalse(np.signbit(self.put).any())      # No -0.00 from parity cancellation
+
+    def test_greeks_kernel_matches(self):
+        """bs_fused_greeks_grid shares the per-cell pricing, and its Greeks agree with BlackScholes."""
+        shape = self.call.shape
+        matrices = tuple(np.empty(shape, dtype=np.float32) for _ in range(4))
+        greeks = tuple(np.empty(shape) for _ in range(6))
+        bs_fused_greeks_grid(STOCK_PRICES, STRIKE, TIME_TO_EXP, RATE, VOLATILITIES, self.base_call, self.base_put, *matrices, *greeks)
+        for actual, expected in zip(matrices, (self.call, self.put, self.call_pnl, self.put_pnl)):
+            np.testing.assert_array_equal(actual, expected)
+
+        call_delta, put_delta, gamma, vega, call_theta, put_theta = greeks
+        for i, sigma in enumerate(VOLATILITIES):
+            for j, S in enumerate(STOCK_PRICES):
+                call = BlackScholes(S, STRIKE, TIME_TO_EXP, RATE, sigma, OptionType.CALL_OPTION).compute_all()
+                put = BlackScholes(S, STRIKE, TIME_TO_EXP, RATE, sigma, OptionType.PUT_OPTION).compute_all()
+                np.testing.assert_allclose(
+                    [call_delta[i, j], put_delta[i, j], gamma[i, j], vega[i, j], call_theta[i, j], put_theta[i, j]],
+                    [call["delta"], put["delta"], call["gamma"], call["vega"], call["theta"], put["theta"]],
+                    rtol=1e-9, atol=1e-12
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
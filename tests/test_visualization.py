@@ -0,0 +1,178 @@
+"""
+Tests for heatmap figure rendering.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from src.visualization import MIN_ANNOT_FONTSIZE, HeatmapGenerator
+
+
+def make_generator(min_stock_price, max_stock_price, grid_n):
+    """Build a generator with computed matrices for the given stock price range."""
+    generator = HeatmapGenerator(100, 1.0, 0.05, min_stock_price, max_stock_price, 0.1, 0.3, 10, 5, grid_n=grid_n)
+    generator.compute_heatmaps()
+    return generator
+
+
+def figures(generator):
+    return [generator.call_graph, generator.put_graph, generator.call_pnl_graph, generator.put_pnl_graph]
+
+
+def render(fig):
+    """Rasterize a figure on its Agg canvas."""
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+class TestUpdateHeatmaps(unittest.TestCase):
+
+    def assertUpdateMatchesFreshBuild(self, before, after, grid_n):
+        """Updating figures built for `before` with `after`'s values renders exactly like building for `after`."""
+        previous = make_generator(*before, grid_n)
+        previous.graph_all_heatmaps()
+        updated = make_generator(*after, grid_n)
+        updated.update_all_heatmaps(*figures(previous))
+        fresh = make_generator(*after, grid_n)
+        fresh.graph_all_heatmaps()
+
+        for updated_fig, previous_fig, fresh_fig in zip(figures(updated), figures(previous), figures(fresh)):
+            self.assertIs(updated_fig, previous_fig)    # Updated in place, not rebuilt
+            ax, fresh_ax = updated_fig.axes[0], fresh_fig.axes[0]
+            self.assertEqual(len(ax.texts), len(fresh_ax.texts))
+            for text in ax.texts:
+                self.assertGreaterEqual(text.get_fontsize(), MIN_ANNOT_FONTSIZE)
+            np.testing.assert_array_equal(render(updated_fig), render(fresh_fig))
+
+    def test_wider_tick_labels(self):
+        self.assertUpdateMatchesFreshBuild((80, 120), (200, 400), grid_n=10)
+
+    def test_annotations_added_when_labels_shrink(self):
+        self.assertUpdateMatchesFreshBuild((80, 120), (8, 13), grid_n=14)
+
+    def test_annotations_removed_when_labels_grow(self):
+        self.assertUpdateMatchesFreshBuild((8, 13), (80, 120), grid_n=14)
+
+    def test_shape_change_rebuilds(self):
+        previous = make_generator(80, 120, grid_n=10)
+        previous.graph_all_heatmaps()
+        updated = make_generator(80, 120, grid_n=12)
+        updated.update_all_heatmaps(*figures(previous))
+        for updated_fig, previous_fig in zip(figures(updated), figures(previous)):
+            self.assertIsNot(updated_fig, previous_fig)
+            self.assertEqual(updated_fig.axes[0].images[0].get_array().shape, (12, 12))
+
+
+
+class TestMatrixCache(unittest.TestCase):
+
+    def setUp(self):
+        HeatmapGenerator._matrix_cache.clear()
+
+    def generator(self, strike=100):
+        return HeatmapGenerator(strike, 1.0, 0.05, 80, 120, 0.1, 0.3, 10, 5, grid_n=10)
+
+    def test_identical_inputs_reuse_matrices(self):
+        first = self.generator()
+        first.compute_heatmaps()
+        with mock.patch.object(HeatmapGenerator, "_compute_all_matrices") as compute:
+            second = self.generator()
+            second.compute_heatmaps()
+            compute.assert_not_called()
+        self.assertIs(second.call_heatmap_values, first.call_heatmap_values)
+        self.assertFalse(second.call_heatmap_values.flags.writeable)    # Shared, so read-only
+
+    def test_least_recently_used_entry_is_evicted(self):
+        size = HeatmapGenerator._matrix_cache_size
+        oldest = self.generator(strike=1)
+        oldest.compute_heatmaps()
+        for strike in range(2, size + 1):
+            self.generator(strike=strike).compute_heatmaps()
+        self.generator(strike=1).compute_heatmaps()     # Refresh, so strike 2 becomes the oldest
+        self.generator(strike=size + 1).compute_heatmaps()
+
+        self.assertEqual(len(HeatmapGenerator._matrix_cache), size)
+        strikes = [key[0] for key in HeatmapGenerator._matrix_cache]
+        self.assertNotIn(2, strikes)
+        self.assertEqual(strikes[-2:], [1, size + 1])
+
+    def test_greeks_request_upgrades_entry(self):
+        self.generator().compute_heatmaps()
+        original = HeatmapGenerator._compute_all_matrices_and_greeks
+        calls = []
+
+        def counting(generator):
+            calls.append(generator)
+            return original(generator)
+
+        with mock.patch.object(HeatmapGenerator, "_compute_all_matrices_and_greeks", counting):
+            with_greeks = self.generator()
+            with_greeks.compute_heatmaps(greeks=True)
+            self.assertEqual(len(calls), 1)     # Entry had no Greeks yet, so it is recomputed once
+            self.generator().compute_heatmaps(greeks=True)
+            self.assertEqual(len(calls), 1)
+        self.assertEqual(len(HeatmapGenerator._matrix_cache), 1)
+        self.assertEqual(set(with_greeks.greeks), {"call_delta", "put_delta", "gamma", "vega", "call_theta", "put_theta"})
+
+        without_greeks = self.generator()
+        without_greeks.compute_heatmaps()
+        self.assertIsNone(without_greeks.greeks)
+        self.assertIs(without_greeks.call_heatmap_values, with_greeks.call_heatmap_values)
+
+
+def fake_gpu_kernel(S, K, T, r, sigma, base_call, base_put):
+    """Stand-in for bs_fused_grid_gpu that marks its output with a sentinel value."""
+    return tuple(np.full((sigma.size, S.size), -1.0, dtype=np.float32) for _ in range(4))
+
+
+class TestBackendDispatch(unittest.TestCase):
+
+    def setUp(self):
+        HeatmapGenerator._matrix_cache.clear()
+
+    def compute(self, backend, grid_n, greeks=False):
+        generator = HeatmapGenerator(100, 1.0, 0.05, 80, 120, 0.1, 0.3, 10, 5, grid_n=grid_n, backend=backend)
+        generator.compute_heatmaps(greeks=greeks)
+        return generator
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            HeatmapGenerator(100, 1.0, 0.05, 80, 120, 0.1, 0.3, backend="gpu")
+
+    @mock.patch("src.visualization.bs_fused_grid_gpu", side_effect=fake_gpu_kernel)
+    @mock.patch("src.visualization.GPU_AVAILABLE", True)
+    def test_auto_uses_gpu_only_for_large_grids(self, gpu_kernel):
+        small = self.compute("auto", grid_n=100)       # 10,000 cells: at the threshold, stays on the CPU
+        gpu_kernel.assert_not_called()
+        self.assertTrue((small.call_heatmap_values >= 0).all())
+
+        large = self.compute("auto", grid_n=101)
+        gpu_kernel.assert_called_once()
+        self.assertTrue((large.call_heatmap_values == -1).all())
+
+    @mock.patch("src.visualization.bs_fused_grid_gpu", side_effect=fake_gpu_kernel)
+    @mock.patch("src.visualization.GPU_AVAILABLE", False)
+    def test_auto_without_gpu_stays_on_cpu(self, gpu_kernel):
+        self.compute("auto", grid_n=101)
+        gpu_kernel.assert_not_called()
+
+    @mock.patch("src.visualization.bs_fused_grid_gpu", side_effect=fake_gpu_kernel)
+    @mock.patch("src.visualization.GPU_AVAILABLE", True)
+    def test_cpu_and_gpu_results_are_cached_separately(self, gpu_kernel):
+        cpu = self.compute("cpu", grid_n=10)
+        gpu = self.compute("cupy", grid_n=10)
+        gpu_kernel.assert_called_once()
+        self.assertTrue((cpu.call_heatmap_values >= 0).all())
+        self.assertTrue((gpu.call_heatmap_values == -1).all())
+
+    @mock.patch("src.visualization.GPU_AVAILABLE", False)
+    def test_cupy_without_gpu(self):
+        with self.assertRaises(RuntimeError):
+            self.compute("cupy", grid_n=10)
+        # The Greeks path always runs on the CPU, so it does not need a GPU
+        generator = self.compute("cupy", grid_n=10, greeks=True)
+        self.assertEqual(generator.greeks["gamma"].shape, (10, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()